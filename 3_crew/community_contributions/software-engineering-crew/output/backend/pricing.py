@@ -1,14 +1,24 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping
 
 __all__ = [
     "PricingError",
     "SymbolNotSupportedError",
     "PriceService",
+    "get_share_price",
 ]
 
+# Fixed test price map, shared by all callers and read-only
+_PRICES_DATA: Dict[str, Decimal] = {
+    "AAPL": Decimal("150.00"),
+    "TSLA": Decimal("250.00"),
+    "GOOGL": Decimal("2750.00"),
+}
+_PRICES: Mapping[str, Decimal] = MappingProxyType(_PRICES_DATA)
+
 
 class PricingError(Exception):
     """Base exception for pricing-related errors."""
@@ -18,6 +28,32 @@ class SymbolNotSupportedError(PricingError):
     """Raised when a requested symbol does not have a configured test price."""
 
 
+def get_share_price(symbol: str) -> Decimal:
+    """Return the fixed test price for the given equity symbol.
+
+    Args:
+        symbol: The equity ticker symbol (e.g., "AAPL", "TSLA", "GOOGL").
+
+    Returns:
+        The price as a Decimal with two decimal places.
+
+    Raises:
+        PricingError: If symbol is not a string or empty after trimming.
+        SymbolNotSupportedError: If the symbol is not supported by this service.
+    """
+    if type(symbol) is not str:
+        raise PricingError("symbol must be a string")
+    sym = symbol.strip()
+    if not sym:
+        raise PricingError("symbol must be a non-empty string")
+    sym = sym.upper()
+
+    try:
+        return _PRICES[sym]
+    except KeyError as exc:
+        raise SymbolNotSupportedError(f"symbol '{sym}' is not supported") from exc
+
+
 class PriceService:
     """Static price provider for a small set of test equities.
 
@@ -33,36 +69,10 @@ class PriceService:
     Notes:
       - Symbols are case-insensitive and normalized to upper-case.
       - Prices are returned as Decimal with two fractional digits.
+      - The service holds no state; get_share_price is the module-level
+        function of the same name, also usable without an instance.
     """
 
-    # Fixed test price map
-    _PRICES: Dict[str, Decimal] = {
-        "AAPL": Decimal("150.00"),
-        "TSLA": Decimal("250.00"),
-        "GOOGL": Decimal("2750.00"),
-    }
-
-    def get_share_price(self, symbol: str) -> Decimal:
-        """Return the fixed test price for the given equity symbol.
-
-        Args:
-            symbol: The equity ticker symbol (e.g., "AAPL", "TSLA", "GOOGL").
-
-        Returns:
-            The price as a Decimal with two decimal places.
-
-        Raises:
-            PricingError: If symbol is not a string or empty after trimming.
-            SymbolNotSupportedError: If the symbol is not supported by this service.
-        """
-        if not isinstance(symbol, str):
-            raise PricingError("symbol must be a string")
-        sym = symbol.strip()
-        if not sym:
-            raise PricingError("symbol must be a non-empty string")
-        sym = sym.upper()
-
-        try:
-            return self._PRICES[sym]
-        except KeyError as exc:
-            raise SymbolNotSupportedError(f"symbol '{sym}' is not supported") from exc
\ No newline at end of file
+    _PRICES: Mapping[str, Decimal] = _PRICES
+
+    get_share_price = staticmethod(get_share_price)
@@ -9,23 +9,39 @@ for storing and retrieving these records without enforcing business rules from
 higher-level services.
 
 This module is intentionally minimal and focuses on storage concerns only:
-  - Accounts: id -> balance (Decimal)
-  - Holdings: account_id -> symbol -> quantity (Decimal)
-  - Transactions: append-only immutable records
+  - Accounts: id -> balance (int cents)
+  - Holdings: account_id -> symbol -> quantity (int 1e-8 units)
+  - Transactions: append-only columns (one list per field), materialized as
+    immutable records when read
 
 Notes:
   - Input validation ensures basic types and normalization (IDs trimmed, symbols
     upper-cased, finite Decimal values).
+  - Balances and positions are held internally as integer minor units and are
+    converted to Decimal only at the API boundary. Cash values (balances and
+    transaction amounts) accept at most 2 decimal places and position
+    quantities at most 8; anything finer raises StorageValidationError rather
+    than being rounded. Values read back are exact Decimals without padding
+    (e.g. Decimal('1.5'), not Decimal('1.50000000')).
   - No monetary rounding or domain validations are applied here; those belong
-    to higher-level services. The store accepts provided Decimal-like values as-is.
-  - Thread-safe via an internal re-entrant lock (RLock).
+    to higher-level services.
+  - Thread-safe via an internal reader/writer lock: reads run concurrently,
+    writes are exclusive. Validation and normalization happen before it is
+    acquired so critical sections only touch the stored maps.
 """
 
+import itertools
+import re
+import secrets
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal, InvalidOperation
-from threading import RLock
-from typing import Dict, List, Optional, Union
+from threading import Condition, Lock
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 from uuid import uuid4
 
 __all__ = [
@@ -35,11 +51,38 @@ __all__ = [
     "DuplicateRecordError",
     "AccountSnapshot",
     "TransactionRecord",
+    "TransactionBatch",
     "InMemoryStore",
 ]
 
 NumberLike = Union[int, float, str, Decimal]
 
+# Validated transaction fields in column order:
+# (id, account_id, kind, ts_ns, amount, symbol, quantity, price, total)
+_TxnRow = Tuple[str, str, str, int, int, Optional[str], Optional[Decimal], Optional[Decimal], Optional[Decimal]]
+
+# Minor-unit scales for integer storage of balances and quantities
+_CASH_PLACES = 2
+_QTY_PLACES = 8
+_SCALE_CASH = 10**_CASH_PLACES
+_SCALE_QTY = 10**_QTY_PLACES
+
+# Decimal is immutable, so the zero value handed out by the store can be shared
+_ZERO = Decimal(0)
+
+# Plain "[-]digits[.digits]" strings can be scaled without going through Decimal
+_PLAIN_NUMBER_RE = re.compile(r"([+-]?[0-9]+)(?:\.([0-9]+))?")
+
+# Canonical (interned) transaction kinds; normalized kinds are always these objects
+_KINDS = frozenset(map(sys.intern, ("DEPOSIT", "WITHDRAWAL", "BUY", "SELL")))
+_KIND_CANON: Dict[str, str] = {k: k for k in _KINDS}
+
+# Canonical symbol strings, bounded so arbitrary input cannot grow it forever
+_SYMBOL_CACHE_MAX = 10_000
+_symbol_canon: Dict[str, str] = {}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
 
 class StorageError(Exception):
     """Base exception for storage-related errors."""
@@ -57,7 +100,7 @@ class DuplicateRecordError(StorageError):
     """Raised when attempting to create a record that already exists."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccountSnapshot:
     """Immutable snapshot of an account record.
 
@@ -70,12 +113,12 @@ class AccountSnapshot:
     balance: Decimal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class TransactionRecord:
     """Immutable transaction record stored by the repository.
 
     Attributes:
-        id: Unique transaction identifier (UUID4 hex).
+        id: Unique transaction identifier (32 lowercase hex characters).
         account_id: The account associated with the transaction.
         kind: One of "DEPOSIT", "WITHDRAWAL", "BUY", "SELL".
         timestamp: UTC timestamp when the transaction was recorded.
@@ -97,6 +140,118 @@ class TransactionRecord:
     price: Optional[Decimal] = None
     total: Optional[Decimal] = None
 
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if type(other) is not TransactionRecord:
+            return NotImplemented
+        # IDs are unique in practice, so unequal records almost always stop here
+        return self.id == other.id and (
+            self.account_id,
+            self.kind,
+            self.timestamp,
+            self.amount,
+            self.symbol,
+            self.quantity,
+            self.price,
+            self.total,
+        ) == (
+            other.account_id,
+            other.kind,
+            other.timestamp,
+            other.amount,
+            other.symbol,
+            other.quantity,
+            other.price,
+            other.total,
+        )
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+
+def _decimal_from_str(value: str) -> Decimal:
+    return Decimal(value.strip())
+
+
+def _decimal_from_float(value: float) -> Decimal:
+    # Go through str() so 0.1 becomes Decimal("0.1"), not its binary expansion
+    return Decimal(str(value))
+
+
+def _decimal_from_decimal(value: Decimal) -> Decimal:
+    return value
+
+
+# Exact-type dispatch for _coerce_decimal, most common input types first
+_DECIMAL_COERCERS = {
+    str: _decimal_from_str,
+    int: Decimal,
+    Decimal: _decimal_from_decimal,
+    float: _decimal_from_float,
+}
+
+
+class _ReadWriteLock:
+    """Reader/writer lock: many concurrent readers or one writer.
+
+    Waiting writers block new readers, so a steady stream of reads cannot
+    starve writes.
+    """
+
+    def __init__(self) -> None:
+        self._cond = Condition(Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+class TransactionBatch:
+    """Transactions collected inside InMemoryStore.batch().
+
+    Each add() validates its fields immediately and returns the transaction
+    ID; the records are written to the store together when the batch exits.
+    """
+
+    def __init__(self, store: InMemoryStore) -> None:
+        self._store = store
+        self._rows: List[_TxnRow] = []
+
+    def add(self, **fields: Any) -> str:
+        """Queue a transaction; accepts the same keyword arguments as add_transaction."""
+        row = self._store._prepare_transaction(**fields)
+        self._rows.append(row)
+        return row[0]
+
 
 class InMemoryStore:
     """Thread-safe in-memory repository for accounts, holdings, and transactions.
@@ -107,10 +262,26 @@ class InMemoryStore:
     """
 
     def __init__(self) -> None:
-        self._lock = RLock()
-        self._accounts: Dict[str, Decimal] = {}
-        self._holdings: Dict[str, Dict[str, Decimal]] = {}
-        self._transactions: List[TransactionRecord] = []
+        self._rwlock = _ReadWriteLock()
+        # Transaction IDs: 12 random hex chars per store + 20-hex-digit counter
+        self._txn_id_prefix = secrets.token_hex(6)
+        self._txn_id_counter = itertools.count()
+        self._accounts: Dict[str, int] = {}
+        self._holdings: Dict[str, Dict[str, int]] = {}
+        # Transactions are stored column-wise; row i of every list is one record
+        self._txn_ids: List[str] = []
+        self._txn_accts: List[str] = []
+        self._txn_kinds: List[str] = []
+        self._txn_ts_ns: List[int] = []
+        self._txn_amounts: List[int] = []
+        self._txn_symbols: List[Optional[str]] = []
+        self._txn_quantities: List[Optional[Decimal]] = []
+        self._txn_prices: List[Optional[Decimal]] = []
+        self._txn_totals: List[Optional[Decimal]] = []
+        # Secondary indexes of row numbers, appended in lockstep with the columns
+        self._by_acct: Dict[str, List[int]] = defaultdict(list)
+        self._by_kind: Dict[str, List[int]] = defaultdict(list)
+        self._by_symbol: Dict[str, List[int]] = defaultdict(list)
 
     # -----------------------------
     # Account storage operations
@@ -121,19 +292,20 @@ class InMemoryStore:
 
         Args:
             account_id: Optional explicit ID; if None, a UUID4 hex is generated.
-            initial_balance: Initial balance (number-like), stored as Decimal.
+            initial_balance: Initial balance (number-like) with at most 2 decimal places.
 
         Returns:
             The created account ID.
 
         Raises:
-            StorageValidationError: If account_id is invalid or initial_balance is not a finite number.
+            StorageValidationError: If account_id is invalid or initial_balance is not a finite number
+                with at most 2 decimal places.
             DuplicateRecordError: If an account with the given ID already exists.
         """
         acc_id = self._normalize_id(account_id) if account_id is not None else uuid4().hex
-        balance = self._coerce_decimal(initial_balance)
+        balance = self._to_cash_int(initial_balance)
 
-        with self._lock:
+        with self._rwlock.write():
             if acc_id in self._accounts:
                 raise DuplicateRecordError(f"account '{acc_id}' already exists")
             self._accounts[acc_id] = balance
@@ -147,44 +319,49 @@ class InMemoryStore:
             RecordNotFoundError: If the account does not exist.
         """
         acc_id = self._normalize_id(account_id)
-        with self._lock:
-            if acc_id not in self._accounts:
-                raise RecordNotFoundError(f"account '{acc_id}' not found")
-            return AccountSnapshot(id=acc_id, balance=self._accounts[acc_id])
+        return AccountSnapshot(id=acc_id, balance=self._from_cash_int(self._balance_of(acc_id)))
 
     def get_balance(self, account_id: str) -> Decimal:
         """Get the current balance for an account."""
-        return self.get_account(account_id).balance
+        return self._from_cash_int(self._balance_of(self._normalize_id(account_id)))
 
     def set_balance(self, account_id: str, new_balance: NumberLike) -> Decimal:
-        """Set the account balance to a new value.
+        """Set the account balance to a new value with at most 2 decimal places.
 
         Returns:
             The stored balance as Decimal.
+
+        Raises:
+            StorageValidationError: If new_balance has more than 2 decimal places.
         """
         acc_id = self._normalize_id(account_id)
-        bal = self._coerce_decimal(new_balance)
-        with self._lock:
+        bal = self._to_cash_int(new_balance)
+        with self._rwlock.write():
             if acc_id not in self._accounts:
                 raise RecordNotFoundError(f"account '{acc_id}' not found")
             self._accounts[acc_id] = bal
-            return bal
+        return self._from_cash_int(bal)
 
     def update_balance(self, account_id: str, delta: NumberLike) -> Decimal:
-        """Add a delta to the account balance and return the new balance."""
+        """Add a delta to the account balance and return the new balance.
+
+        Raises:
+            StorageValidationError: If delta has more than 2 decimal places.
+        """
         acc_id = self._normalize_id(account_id)
-        d = self._coerce_decimal(delta)
-        with self._lock:
+        d = self._to_cash_int(delta)
+        with self._rwlock.write():
             if acc_id not in self._accounts:
                 raise RecordNotFoundError(f"account '{acc_id}' not found")
-            new_bal = self._accounts[acc_id] + d
-            self._accounts[acc_id] = new_bal
-            return new_bal
+            self._accounts[acc_id] += d
+            new_bal = self._accounts[acc_id]
+        return self._from_cash_int(new_bal)
 
     def list_accounts(self) -> List[AccountSnapshot]:
         """List all accounts as immutable snapshots."""
-        with self._lock:
-            return [AccountSnapshot(id=k, balance=v) for k, v in self._accounts.items()]
+        with self._rwlock.read():
+            items = list(self._accounts.items())
+        return [AccountSnapshot(id=k, balance=self._from_cash_int(v)) for k, v in items]
 
     # -----------------------------
     # Holdings storage operations
@@ -198,19 +375,21 @@ class InMemoryStore:
             RecordNotFoundError: If the account does not exist.
         """
         acc_id = self._normalize_id(account_id)
-        with self._lock:
+        with self._rwlock.read():
             if acc_id not in self._accounts:
                 raise RecordNotFoundError(f"account '{acc_id}' not found")
-            return dict(self._holdings.get(acc_id, {}))
+            positions = list(self._holdings.get(acc_id, {}).items())
+        return {sym: self._from_qty_int(q) for sym, q in positions}
 
     def get_position(self, account_id: str, symbol: str) -> Decimal:
-        """Get the quantity held for a specific symbol; returns Decimal(0) if none."""
+        """Get the quantity held for a specific symbol; returns zero if none."""
         acc_id = self._normalize_id(account_id)
         sym = self._normalize_symbol(symbol)
-        with self._lock:
+        with self._rwlock.read():
             if acc_id not in self._accounts:
                 raise RecordNotFoundError(f"account '{acc_id}' not found")
-            return self._holdings.get(acc_id, {}).get(sym, Decimal(0))
+            qty = self._holdings.get(acc_id, {}).get(sym, 0)
+        return self._from_qty_int(qty)
 
     def set_position(self, account_id: str, symbol: str, quantity: NumberLike) -> Decimal:
         """Set the position quantity for a symbol, replacing any existing value.
@@ -219,41 +398,53 @@ class InMemoryStore:
 
         Returns:
             The stored quantity as Decimal.
+
+        Raises:
+            StorageValidationError: If quantity has more than 8 decimal places.
         """
         acc_id = self._normalize_id(account_id)
         sym = self._normalize_symbol(symbol)
-        qty = self._coerce_decimal(quantity)
-        with self._lock:
+        qty = self._to_qty_int(quantity)
+        with self._rwlock.write():
             if acc_id not in self._accounts:
                 raise RecordNotFoundError(f"account '{acc_id}' not found")
-            acct_pos = self._holdings.setdefault(acc_id, {})
-            if qty == Decimal(0):
-                acct_pos.pop(sym, None)
-                # clean empty map
-                if not acct_pos:
-                    self._holdings.pop(acc_id, None)
-                return Decimal(0)
-            acct_pos[sym] = qty
-            return qty
+            if qty:
+                self._holdings.setdefault(acc_id, {})[sym] = qty
+            else:
+                acct_pos = self._holdings.get(acc_id)
+                if acct_pos is not None:
+                    acct_pos.pop(sym, None)
+                    # clean empty map
+                    if not acct_pos:
+                        del self._holdings[acc_id]
+        return self._from_qty_int(qty)
 
     def adjust_position(self, account_id: str, symbol: str, delta: NumberLike) -> Decimal:
-        """Adjust the position quantity for a symbol by a delta and return the new quantity."""
+        """Adjust the position quantity for a symbol by a delta and return the new quantity.
+
+        Raises:
+            StorageValidationError: If delta has more than 8 decimal places.
+        """
         acc_id = self._normalize_id(account_id)
         sym = self._normalize_symbol(symbol)
-        d = self._coerce_decimal(delta)
-        with self._lock:
+        d = self._to_qty_int(delta)
+        with self._rwlock.write():
             if acc_id not in self._accounts:
                 raise RecordNotFoundError(f"account '{acc_id}' not found")
-            acct_pos = self._holdings.setdefault(acc_id, {})
-            cur = acct_pos.get(sym, Decimal(0))
-            new_qty = cur + d
-            if new_qty == Decimal(0):
-                acct_pos.pop(sym, None)
-                if not acct_pos:
-                    self._holdings.pop(acc_id, None)
-                return Decimal(0)
-            acct_pos[sym] = new_qty
-            return new_qty
+            acct_pos = self._holdings.get(acc_id)
+            if acct_pos is None:
+                new_qty = d
+                if new_qty:
+                    self._holdings[acc_id] = {sym: new_qty}
+            else:
+                new_qty = acct_pos.get(sym, 0) + d
+                if new_qty:
+                    acct_pos[sym] = new_qty
+                else:
+                    acct_pos.pop(sym, None)
+                    if not acct_pos:
+                        del self._holdings[acc_id]
+        return self._from_qty_int(new_qty)
 
     # -----------------------------
     # Transaction storage operations
@@ -275,11 +466,130 @@ class InMemoryStore:
         """Append a new transaction record and return its ID.
 
         This method performs basic validation and normalization but does not apply
-        any business rules (e.g., sign of amounts, sufficiency checks).
+        any business rules (e.g., sign of amounts, sufficiency checks). The amount
+        must have at most 2 decimal places or StorageValidationError is raised.
+        """
+        row = self._prepare_transaction(
+            account_id=account_id,
+            kind=kind,
+            amount=amount,
+            symbol=symbol,
+            quantity=quantity,
+            price=price,
+            total=total,
+            timestamp=timestamp,
+            txn_id=txn_id,
+        )
+        with self._rwlock.write():
+            self._append_rows([row])
+        return row[0]
+
+    def add_transactions(self, transactions: Iterable[Mapping[str, Any]]) -> List[str]:
+        """Append several transactions under a single lock acquisition.
+
+        Each mapping holds the keyword arguments of add_transaction. All entries
+        are validated first and either every record is stored or none is.
+
+        Returns:
+            The IDs of the stored transactions, in input order.
+
+        Raises:
+            StorageValidationError: If any entry fails validation.
+            RecordNotFoundError: If any entry references an unknown account.
         """
+        rows = [self._prepare_transaction(**fields) for fields in transactions]
+        if rows:
+            with self._rwlock.write():
+                self._append_rows(rows)
+        return [row[0] for row in rows]
+
+    @contextmanager
+    def batch(self) -> Iterator[TransactionBatch]:
+        """Collect transactions and store them together when the block exits.
+
+        Nothing is written if the block raises.
+
+        Example:
+            with store.batch() as b:
+                b.add(account_id="a1", kind="DEPOSIT", amount="10.00")
+                b.add(account_id="a1", kind="WITHDRAWAL", amount="-2.50")
+        """
+        pending = TransactionBatch(self)
+        yield pending
+        if pending._rows:
+            with self._rwlock.write():
+                self._append_rows(pending._rows)
+
+    def list_transactions(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        kind: Optional[str] = None,
+        symbol: Optional[str] = None,
+    ) -> List[TransactionRecord]:
+        """List transactions with optional filtering by account, kind, and symbol."""
+        rows = self._select_rows(account_id, kind, symbol)
+        return [self._record_at(i) for i in rows]
+
+    def sum_amounts(
+        self,
+        account_id: Optional[str] = None,
+        *,
+        kind: Optional[str] = None,
+        symbol: Optional[str] = None,
+    ) -> Decimal:
+        """Sum transaction amounts matching the same filters as list_transactions.
+
+        The sum is computed over the stored integer amounts without building
+        transaction records.
+        """
+        if account_id is None and kind is None and symbol is None:
+            with self._rwlock.read():
+                total = sum(self._txn_amounts)
+            return self._from_cash_int(total)
+        rows = self._select_rows(account_id, kind, symbol)
+        return self._from_cash_int(sum(map(self._txn_amounts.__getitem__, rows)))
+
+    def get_account_transactions(
+        self,
+        account_id: str,
+        *,
+        kind: Optional[str] = None,
+        symbol: Optional[str] = None,
+    ) -> List[TransactionRecord]:
+        """Convenience wrapper to list transactions for a single account."""
+        rows = self._select_rows(account_id, kind, symbol)
+        return [self._record_at(i) for i in rows]
+
+    # -----------------------------
+    # Internal helpers
+    # -----------------------------
+
+    def _balance_of(self, acc_id: str) -> int:
+        """Return the stored integer balance for an already-normalized account ID."""
+        with self._rwlock.read():
+            bal = self._accounts.get(acc_id)
+        if bal is None:
+            raise RecordNotFoundError(f"account '{acc_id}' not found")
+        return bal
+
+    def _prepare_transaction(
+        self,
+        *,
+        account_id: str,
+        kind: str,
+        amount: NumberLike,
+        symbol: Optional[str] = None,
+        quantity: Optional[NumberLike] = None,
+        price: Optional[NumberLike] = None,
+        total: Optional[NumberLike] = None,
+        timestamp: Optional[datetime] = None,
+        txn_id: Optional[str] = None,
+    ) -> _TxnRow:
+        """Validate and normalize transaction fields without touching stored state."""
         acc_id = self._normalize_id(account_id)
         k = self._normalize_kind(kind)
-        amt = self._coerce_decimal(amount)
+        amt = self._to_cash_int(amount)
         sym: Optional[str] = None
         qty: Optional[Decimal] = None
         px: Optional[Decimal] = None
@@ -294,38 +604,46 @@ class InMemoryStore:
         if total is not None:
             ttl = self._coerce_decimal(total)
 
-        ts = timestamp if timestamp is not None else datetime.now(timezone.utc)
-        if ts.tzinfo is None:
-            # Ensure timezone-aware UTC timestamp
-            ts = ts.replace(tzinfo=timezone.utc)
-
-        tid = txn_id if txn_id is not None else uuid4().hex
-
-        with self._lock:
-            if acc_id not in self._accounts:
-                raise RecordNotFoundError(f"account '{acc_id}' not found")
-            rec = TransactionRecord(
-                id=tid,
-                account_id=acc_id,
-                kind=k,
-                timestamp=ts,
-                amount=amt,
-                symbol=sym,
-                quantity=qty,
-                price=px,
-                total=ttl,
-            )
-            self._transactions.append(rec)
-            return tid
-
-    def list_transactions(
+        if timestamp is None:
+            ts_ns = time.time_ns()
+        else:
+            if timestamp.tzinfo is None:
+                # Naive timestamps are taken to be UTC
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+            ts_ns = (timestamp - _EPOCH) // timedelta(microseconds=1) * 1000
+
+        tid = txn_id if txn_id is not None else f"{self._txn_id_prefix}{next(self._txn_id_counter):020x}"
+        return (tid, acc_id, k, ts_ns, amt, sym, qty, px, ttl)
+
+    def _append_rows(self, rows: List[_TxnRow]) -> None:
+        """Append prepared rows to the columns and indexes; caller holds the write lock."""
+        for row in rows:
+            if row[1] not in self._accounts:
+                raise RecordNotFoundError(f"account '{row[1]}' not found")
+
+        for tid, acc_id, k, ts_ns, amt, sym, qty, px, ttl in rows:
+            i = len(self._txn_ids)
+            self._txn_ids.append(tid)
+            self._txn_accts.append(acc_id)
+            self._txn_kinds.append(k)
+            self._txn_ts_ns.append(ts_ns)
+            self._txn_amounts.append(amt)
+            self._txn_symbols.append(sym)
+            self._txn_quantities.append(qty)
+            self._txn_prices.append(px)
+            self._txn_totals.append(ttl)
+            self._by_acct[acc_id].append(i)
+            self._by_kind[k].append(i)
+            if sym is not None:
+                self._by_symbol[sym].append(i)
+
+    def _select_rows(
         self,
-        account_id: Optional[str] = None,
-        *,
-        kind: Optional[str] = None,
-        symbol: Optional[str] = None,
-    ) -> List[TransactionRecord]:
-        """List transactions with optional filtering by account, kind, and symbol."""
+        account_id: Optional[str],
+        kind: Optional[str],
+        symbol: Optional[str],
+    ) -> List[int]:
+        """Return the transaction row numbers matching the given filters, in insertion order."""
         acc_norm: Optional[str] = None
         kind_norm: Optional[str] = None
         sym_norm: Optional[str] = None
@@ -337,33 +655,48 @@ class InMemoryStore:
         if symbol is not None:
             sym_norm = self._normalize_symbol(symbol)
 
-        with self._lock:
+        with self._rwlock.read():
             # If account filter provided, ensure it exists for clearer semantics
             if acc_norm is not None and acc_norm not in self._accounts:
                 raise RecordNotFoundError(f"account '{acc_norm}' not found")
 
-            result = [
-                t
-                for t in self._transactions
-                if (acc_norm is None or t.account_id == acc_norm)
-                and (kind_norm is None or t.kind == kind_norm)
-                and (sym_norm is None or t.symbol == sym_norm)
-            ]
-            return list(result)
-
-    def get_account_transactions(
-        self,
-        account_id: str,
-        *,
-        kind: Optional[str] = None,
-        symbol: Optional[str] = None,
-    ) -> List[TransactionRecord]:
-        """Convenience wrapper to list transactions for a single account."""
-        return self.list_transactions(account_id=account_id, kind=kind, symbol=symbol)
-
-    # -----------------------------
-    # Internal helpers
-    # -----------------------------
+            # Start from the smallest applicable index, then filter the rest
+            base = range(len(self._txn_ids))
+            if acc_norm is not None:
+                base = min(base, self._by_acct.get(acc_norm, []), key=len)
+            if kind_norm is not None:
+                base = min(base, self._by_kind.get(kind_norm, []), key=len)
+            if sym_norm is not None:
+                base = min(base, self._by_symbol.get(sym_norm, []), key=len)
+            rows = list(base)
+
+        # Columns are append-only, so the captured rows stay valid without the lock
+        checks = [
+            (column, value)
+            for column, value in (
+                (self._txn_accts, acc_norm),
+                (self._txn_kinds, kind_norm),
+                (self._txn_symbols, sym_norm),
+            )
+            if value is not None
+        ]
+        # With at most one filter the chosen index is already the exact result
+        if len(checks) <= 1:
+            return rows
+        return [i for i in rows if all(column[i] == value for column, value in checks)]
+
+    def _record_at(self, row: int) -> TransactionRecord:
+        return TransactionRecord(
+            id=self._txn_ids[row],
+            account_id=self._txn_accts[row],
+            kind=self._txn_kinds[row],
+            timestamp=_EPOCH + timedelta(microseconds=self._txn_ts_ns[row] // 1000),
+            amount=self._from_cash_int(self._txn_amounts[row]),
+            symbol=self._txn_symbols[row],
+            quantity=self._txn_quantities[row],
+            price=self._txn_prices[row],
+            total=self._txn_totals[row],
+        )
 
     def _normalize_id(self, account_id: str) -> str:
         if not isinstance(account_id, str):
@@ -374,38 +707,112 @@ class InMemoryStore:
         return acc_id
 
     def _normalize_symbol(self, symbol: str) -> str:
-        if not isinstance(symbol, str):
+        # Fast path: input that is already a known canonical symbol (e.g. "AAPL")
+        if type(symbol) is str:
+            canon = _symbol_canon.get(symbol)
+            if canon is not None:
+                return canon
+        elif not isinstance(symbol, str):
             raise StorageValidationError("symbol must be a string")
         sym = symbol.strip()
         if not sym:
             raise StorageValidationError("symbol must be a non-empty string")
-        return sym.upper()
+        sym = sym.upper()
+        canon = _symbol_canon.get(sym)
+        if canon is None:
+            canon = sym
+            if len(_symbol_canon) < _SYMBOL_CACHE_MAX:
+                _symbol_canon[sym] = sym
+        return canon
 
     def _normalize_kind(self, kind: str) -> str:
-        if not isinstance(kind, str):
+        # Fast path: input that is already canonical (e.g. "BUY")
+        if type(kind) is str:
+            canon = _KIND_CANON.get(kind)
+            if canon is not None:
+                return canon
+        elif not isinstance(kind, str):
             raise StorageValidationError("kind must be a string")
-        k = kind.strip().upper()
-        if k not in {"DEPOSIT", "WITHDRAWAL", "BUY", "SELL"}:
-            raise StorageValidationError("kind must be one of: DEPOSIT, WITHDRAWAL, BUY, SELL")
-        return k
+        try:
+            return _KIND_CANON[kind.strip().upper()]
+        except KeyError:
+            raise StorageValidationError("kind must be one of: DEPOSIT, WITHDRAWAL, BUY, SELL") from None
 
     def _coerce_decimal(self, value: NumberLike) -> Decimal:
-        try:
-            if isinstance(value, Decimal):
-                d = value
-            elif isinstance(value, int):
-                d = Decimal(value)
-            elif isinstance(value, float):
-                d = Decimal(str(value))
-            elif isinstance(value, str):
-                d = Decimal(value.strip())
+        value_type = type(value)
+        coerce = _DECIMAL_COERCERS.get(value_type)
+        if coerce is None:
+            # Subclasses (e.g. bool) fall back to the handler of their base type
+            for base, handler in _DECIMAL_COERCERS.items():
+                if isinstance(value, base):
+                    coerce = handler
+                    break
             else:
                 raise StorageValidationError(
                     "value must be a number-like type (int, float, str, Decimal)"
                 )
+        try:
+            d = coerce(value)
         except (InvalidOperation, ValueError) as exc:
             raise StorageValidationError("value is not a valid number") from exc
 
-        if not d.is_finite():
+        # Integers are always finite; only parsed or passed-through values need the check
+        if value_type is not int and not d.is_finite():
             raise StorageValidationError("value must be a finite number")
-        return d
\ No newline at end of file
+        return d
+
+    def _to_cash_int(self, value: NumberLike) -> int:
+        return self._to_scaled_int(value, _CASH_PLACES, _SCALE_CASH)
+
+    def _to_qty_int(self, value: NumberLike) -> int:
+        return self._to_scaled_int(value, _QTY_PLACES, _SCALE_QTY)
+
+    def _to_scaled_int(self, value: NumberLike, places: int, scale: int) -> int:
+        """Convert a number-like value to an integer count of 10**-places units.
+
+        Values that are not exact multiples of the unit raise StorageValidationError;
+        nothing is rounded.
+        """
+        # Fast paths: plain decimal strings and ints never touch Decimal
+        value_type = type(value)
+        if value_type is str:
+            m = _PLAIN_NUMBER_RE.fullmatch(value.strip())
+            if m is not None:
+                # Trailing zeros carry no precision, so "1.000" scales like Decimal("1.000")
+                whole, frac = m.group(1), (m.group(2) or "").rstrip("0")
+                if len(frac) > places:
+                    raise StorageValidationError(f"value must have at most {places} decimal places")
+                return int(whole + frac.ljust(places, "0"))
+        elif value_type is int:
+            return value * scale
+
+        # Scale with integer arithmetic; Decimal operations would round to the context precision
+        sign, digits, exponent = self._coerce_decimal(value).as_tuple()
+        n = int("".join(map(str, digits)))
+        shift = exponent + places
+        if shift >= 0:
+            n *= 10**shift
+        else:
+            n, rem = divmod(n, 10**-shift)
+            if rem:
+                raise StorageValidationError(f"value must have at most {places} decimal places")
+        return -n if sign else n
+
+    def _from_cash_int(self, value: int) -> Decimal:
+        return self._from_scaled_int(value, _CASH_PLACES)
+
+    def _from_qty_int(self, value: int) -> Decimal:
+        return self._from_scaled_int(value, _QTY_PLACES)
+
+    def _from_scaled_int(self, value: int, places: int) -> Decimal:
+        """Convert an integer count of 10**-places units back to an exact Decimal.
+
+        Trailing zero places are dropped (1.5, not 1.50000000). Decimal's string
+        constructor is exact, unlike division or scaleb under the default context.
+        """
+        if not value:
+            return _ZERO
+        while places and not value % 10:
+            value //= 10
+            places -= 1
+        return Decimal(f"{value}E-{places}") if places else Decimal(value)
\ No newline at end of file
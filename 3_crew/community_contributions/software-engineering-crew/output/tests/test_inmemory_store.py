@@ -0,0 +1,173 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from output.backend.storage import (
+    InMemoryStore,
+    RecordNotFoundError,
+    StorageValidationError,
+)
+
+
+def _store_with_trades():
+    store = InMemoryStore()
+    store.create_account("a1", initial_balance="1000.00")
+    store.create_account("a2", initial_balance="500.00")
+    ids = store.add_transactions(
+        [
+            {"account_id": "a1", "kind": "DEPOSIT", "amount": "100.00"},
+            {"account_id": "a1", "kind": "BUY", "amount": "-50.00", "symbol": "aapl", "quantity": "1"},
+            {"account_id": "a1", "kind": "BUY", "amount": "-20.00", "symbol": "MSFT", "quantity": "2"},
+            {"account_id": "a2", "kind": "BUY", "amount": "-30.00", "symbol": "AAPL", "quantity": "3"},
+            {"account_id": "a1", "kind": "SELL", "amount": "25.00", "symbol": "AAPL", "quantity": "1"},
+            {"account_id": "a2", "kind": "WITHDRAWAL", "amount": "-10.00"},
+        ]
+    )
+    return store, ids
+
+
+def test_list_transactions_filter_combinations():
+    store, ids = _store_with_trades()
+
+    def listed(**filters):
+        return [t.id for t in store.list_transactions(**filters)]
+
+    assert listed() == ids
+    assert listed(account_id="a1") == [ids[0], ids[1], ids[2], ids[4]]
+    assert listed(kind="buy") == [ids[1], ids[2], ids[3]]
+    assert listed(symbol="aapl") == [ids[1], ids[3], ids[4]]
+    assert listed(account_id="a1", kind="BUY") == [ids[1], ids[2]]
+    assert listed(account_id="a2", symbol="AAPL") == [ids[3]]
+    assert listed(kind="SELL", symbol="AAPL") == [ids[4]]
+    assert listed(account_id="a1", kind="BUY", symbol="AAPL") == [ids[1]]
+    assert listed(account_id="a2", kind="SELL") == []
+    assert listed(symbol="TSLA") == []
+
+    assert [t.id for t in store.get_account_transactions("a2", kind="WITHDRAWAL")] == [ids[5]]
+
+    with pytest.raises(RecordNotFoundError):
+        store.list_transactions("missing")
+
+
+def test_sum_amounts_matches_filters():
+    store, _ = _store_with_trades()
+    assert store.sum_amounts() == Decimal("15")
+    assert store.sum_amounts("a1") == Decimal("55")
+    assert store.sum_amounts(kind="BUY") == Decimal("-100")
+    assert store.sum_amounts("a1", kind="BUY", symbol="AAPL") == Decimal("-50")
+    assert store.sum_amounts("a2", kind="SELL") == Decimal("0")
+
+
+def test_add_transactions_rolls_back_on_unknown_account():
+    store = InMemoryStore()
+    store.create_account("a1")
+    with pytest.raises(RecordNotFoundError):
+        store.add_transactions(
+            [
+                {"account_id": "a1", "kind": "DEPOSIT", "amount": "10.00"},
+                {"account_id": "ghost", "kind": "DEPOSIT", "amount": "5.00"},
+            ]
+        )
+    assert store.list_transactions() == []
+    assert store.list_transactions(kind="DEPOSIT") == []
+
+
+def test_batch_rolls_back_on_unknown_account_or_error():
+    store = InMemoryStore()
+    store.create_account("a1")
+
+    with pytest.raises(RecordNotFoundError):
+        with store.batch() as b:
+            b.add(account_id="a1", kind="DEPOSIT", amount="10.00")
+            b.add(account_id="ghost", kind="DEPOSIT", amount="5.00")
+    assert store.list_transactions() == []
+
+    with pytest.raises(RuntimeError):
+        with store.batch() as b:
+            b.add(account_id="a1", kind="DEPOSIT", amount="10.00")
+            raise RuntimeError("abort")
+    assert store.list_transactions() == []
+
+    with store.batch() as b:
+        first = b.add(account_id="a1", kind="DEPOSIT", amount="10.00")
+        second = b.add(account_id="a1", kind="WITHDRAWAL", amount="-2.50")
+    assert [t.id for t in store.list_transactions("a1")] == [first, second]
+
+
+def test_transaction_timestamps_are_utc():
+    store = InMemoryStore()
+    store.create_account("a1")
+    store.add_transaction(account_id="a1", kind="DEPOSIT", amount="1.00")
+    store.add_transaction(
+        account_id="a1", kind="DEPOSIT", amount="2.00", timestamp=datetime(2024, 1, 2, 3, 4, 5, 678901)
+    )
+    aware = datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+    store.add_transaction(account_id="a1", kind="DEPOSIT", amount="3.00", timestamp=aware)
+
+    txns = store.list_transactions("a1")
+    assert all(t.timestamp.tzinfo == timezone.utc for t in txns)
+    # Naive timestamps are taken as UTC and round-trip to the microsecond
+    assert txns[1].timestamp == aware
+    assert txns[2].timestamp == aware
+
+
+def test_minor_unit_round_trip():
+    store = InMemoryStore()
+    aid = store.create_account("a1", initial_balance="10.25")
+    assert store.get_balance(aid) == Decimal("10.25")
+    assert str(store.get_balance(aid)) == "10.25"
+
+    assert str(store.set_balance(aid, 0)) == "0"
+    assert str(store.update_balance(aid, Decimal("0.1"))) == "0.1"
+    assert str(store.update_balance(aid, 100)) == "100.1"
+
+    assert str(store.set_position(aid, "aapl", "1.5")) == "1.5"
+    assert str(store.adjust_position(aid, "AAPL", "0.00000001")) == "1.50000001"
+    assert str(store.get_position(aid, "MSFT")) == "0"
+    assert store.get_holdings(aid) == {"AAPL": Decimal("1.50000001")}
+
+    tid = store.add_transaction(account_id=aid, kind="DEPOSIT", amount=1.5)
+    (txn,) = [t for t in store.list_transactions(aid) if t.id == tid]
+    assert str(txn.amount) == "1.5"
+
+
+def test_values_finer_than_minor_unit_are_rejected():
+    store = InMemoryStore()
+    aid = store.create_account("a1")
+    with pytest.raises(StorageValidationError):
+        store.set_balance(aid, "0.001")
+    with pytest.raises(StorageValidationError):
+        store.update_balance(aid, Decimal("0.005"))
+    with pytest.raises(StorageValidationError):
+        store.set_position(aid, "AAPL", "0.000000001")
+    with pytest.raises(StorageValidationError):
+        store.add_transaction(account_id=aid, kind="DEPOSIT", amount="1.001")
+    assert store.get_balance(aid) == Decimal("0")
+    assert store.get_holdings(aid) == {}
+    assert store.list_transactions() == []
+
+
+def test_trailing_zeros_beyond_minor_unit_are_accepted():
+    store = InMemoryStore()
+    aid = store.create_account("a1")
+    assert store.set_balance(aid, "1.000") == store.set_balance(aid, Decimal("1.000")) == Decimal("1")
+    assert store.set_balance(aid, "2.50000000000") == Decimal("2.5")
+    assert store.set_position(aid, "AAPL", "1.0000000000") == Decimal("1")
+    assert store.set_position(aid, "AAPL", Decimal("1.0000000000")) == Decimal("1")
+    with pytest.raises(StorageValidationError):
+        store.set_balance(aid, "1.0010")
+    with pytest.raises(StorageValidationError):
+        store.set_balance(aid, Decimal("1.0010"))
+
+
+def test_conversions_are_exact_beyond_default_decimal_precision():
+    store = InMemoryStore()
+    aid = store.create_account("a1")
+    big = "1234567890123456789012345678901.25"
+    assert str(store.set_balance(aid, big)) == big
+    assert str(store.set_balance(aid, Decimal(big))) == big
+    assert str(store.get_balance(aid)) == big
+    with pytest.raises(StorageValidationError):
+        store.set_balance(aid, Decimal("1234567890123456789012345678.001"))
+    assert str(store.set_position(aid, "AAPL", "123456789012345678901234.00000001")) == "123456789012345678901234.00000001"
@@ -1,5 +1,7 @@
 import gradio as gr
+from contextlib import asynccontextmanager
 from sidekick import Sidekick
+from sidekick_tools import close_playwright
 
 
 async def setup():
@@ -28,6 +30,12 @@ def free_resources(sidekick):
         print(f"Exception during cleanup: {e}")
 
 
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    # Sessions only close their own browsers; the shared Playwright driver stops with the server
+    await close_playwright()
+
 
 with gr.Blocks(title="Sidekick", theme=gr.themes.Default(primary_hue="emerald")) as ui:
     gr.Markdown("## Sidekick Personal Co-Worker")
@@ -73,4 +81,4 @@ with gr.Blocks(title="Sidekick", theme=gr.themes.Default(primary_hue="emerald"))
     reset_button.click(reset, [], [message, success_criteria, chatbot, sidekick, file_uploader])
 
 
-ui.launch(inbrowser=True)
+ui.launch(inbrowser=True, app_kwargs={"lifespan": lifespan})
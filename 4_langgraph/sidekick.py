@@ -47,10 +47,9 @@ class Sidekick:
         self.sidekick_id = str(uuid.uuid4())
         self.memory = MemorySaver()
         self.browser = None
-        self.playwright = None
 
     async def setup(self):
-        self.tools, self.browser, self.playwright = await playwright_tools()
+        self.tools, self.browser = await playwright_tools()
         self.tools += await other_tools()
         worker_llm = ChatOpenAI(model="gpt-4.1-mini")
         self.worker_llm_with_tools = worker_llm.bind_tools(self.tools)
@@ -242,13 +241,9 @@ class Sidekick:
             try:
                 loop = asyncio.get_running_loop()
                 loop.create_task(self.browser.close())
-                if self.playwright:
-                    loop.create_task(self.playwright.stop())
             except RuntimeError:
                 # If no loop is running, do a direct run
                 asyncio.run(self.browser.close())
-                if self.playwright:
-                    asyncio.run(self.playwright.stop())
 
 
     async def extract_file_content(self, file_path):
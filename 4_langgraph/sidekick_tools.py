@@ -1,15 +1,19 @@
 from playwright.async_api import async_playwright
 from langchain_community.agent_toolkits import PlayWrightBrowserToolkit
 from dotenv import load_dotenv
+import asyncio
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import subprocess
 import sys
+from pathlib import Path
 from langchain.agents import Tool
 from langchain_community.agent_toolkits import FileManagementToolkit
 from langchain_community.tools.wikipedia.tool import WikipediaQueryRun
 from langchain_experimental.tools import PythonREPLTool
-from langchain_community.utilities import GoogleSerperAPIWrapper
+from langchain_community.utilities import GoogleSerperAPIWrapper, google_serper
 from langchain_community.utilities.wikipedia import WikipediaAPIWrapper
 
 
@@ -20,6 +24,15 @@ pushover_user = os.getenv("PUSHOVER_USER")
 pushover_url = "https://api.pushover.net/1/messages.json"
 serper = GoogleSerperAPIWrapper()
 
+# One keep-alive session shared by push and search, sized for concurrent sidekick sessions
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=50, max_retries=Retry(total=2, backoff_factor=0.2)))
+
+# GoogleSerperAPIWrapper posts through its module's `requests`; pointing that at the shared
+# session lets its public run() reuse the pool. Should the wrapper stop using that name,
+# search falls back to a plain requests.post and keeps working.
+google_serper.requests = _session
+
 # async def playwright_tools():
 #     playwright = await async_playwright().start()
 
@@ -29,55 +42,93 @@ serper = GoogleSerperAPIWrapper()
 #     toolkit = PlayWrightBrowserToolkit.from_browser(async_browser=browser)
 #     return toolkit.get_tools(), browser, playwright
 
+def ensure_playwright_installed():
+    """Install chromium and its system deps only when they are not already present"""
+    cache = Path(os.environ.get("PLAYWRIGHT_BROWSERS_PATH", Path.home() / ".cache" / "ms-playwright"))
+    deps_marker = cache / ".deps_installed"
+    if not deps_marker.exists():
+        result = subprocess.run([sys.executable, "-m", "playwright", "install-deps"], capture_output=True)
+        if result.returncode == 0:
+            cache.mkdir(parents=True, exist_ok=True)
+            deps_marker.touch()
+    # Playwright writes INSTALLATION_COMPLETE into each finished browser download
+    if not any(cache.glob("chromium*/INSTALLATION_COMPLETE")):
+        subprocess.run([sys.executable, "-m", "playwright", "install", "chromium"], capture_output=True)
+
+
+# One Playwright driver per process, shared by every sidekick session
+_playwright = None
+_playwright_lock = asyncio.Lock()
+
+
+async def get_playwright():
+    global _playwright
+    async with _playwright_lock:
+        if _playwright is None:
+            ensure_playwright_installed()
+            _playwright = await async_playwright().start()
+        return _playwright
+
+
+async def close_playwright():
+    """Stop the shared driver once on app shutdown, closing any browsers still open"""
+    global _playwright
+    async with _playwright_lock:
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
+
+
 async def playwright_tools():
     try:
-        # from playwright.async_api import async_playwright
-        # import subprocess
-        # import sys
-        
-        # Install dependencies
-        subprocess.run([sys.executable, "-m", "playwright", "install-deps"], capture_output=True)
-        subprocess.run([sys.executable, "-m", "playwright", "install", "chromium"], capture_output=True)
-        
-        playwright = await async_playwright().start()
-        
+        playwright = await get_playwright()
+
+        # The toolkit drives browser.contexts[0], so each session keeps its own browser
         browser = await playwright.chromium.launch(
             headless=True,
             args=['--no-sandbox', '--disable-dev-shm-usage']
         )
         
         toolkit = PlayWrightBrowserToolkit.from_browser(async_browser=browser)
-        return toolkit.get_tools(), browser, playwright
+        return toolkit.get_tools(), browser
         
     except Exception as e:
         print(f"Playwright failed, continuing without browser: {e}")
-        return [], None, None
+        return [], None
 
 def push(text: str):
     """Send a push notification to the user"""
-    requests.post(pushover_url, data = {"token": pushover_token, "user": pushover_user, "message": text})
+    _session.post(pushover_url, data = {"token": pushover_token, "user": pushover_user, "message": text}, timeout=5)
     return "success"
 
 
+def search(query: str) -> str:
+    """Run a Serper web search over the shared session"""
+    return serper.run(query)
+
+
 def get_file_tools():
     toolkit = FileManagementToolkit(root_dir="sandbox")
     return toolkit.get_tools()
 
 
 async def other_tools():
+    # Constructors block (WikipediaAPIWrapper imports the wikipedia package), so build them in parallel threads
+    file_tools, wikipedia, python_repl = await asyncio.gather(
+        asyncio.to_thread(get_file_tools),
+        asyncio.to_thread(WikipediaAPIWrapper),
+        asyncio.to_thread(PythonREPLTool),
+    )
+
     push_tool = Tool(name="send_push_notification", func=push, description="Use this tool when you want to send a push notification")
-    file_tools = get_file_tools()
 
     tool_search =Tool(
         name="search",
-        func=serper.run,
+        func=search,
         description="Use this tool when you want to get the results of an online web search"
     )
 
-    wikipedia = WikipediaAPIWrapper()
     wiki_tool = WikipediaQueryRun(api_wrapper=wikipedia)
 
-    python_repl = PythonREPLTool()
-    
     return file_tools + [push_tool, tool_search, python_repl,  wiki_tool]
 
@@ -24,6 +24,9 @@ mapper = {
 
 trading_thread = None
 
+# Column order of Transaction.model_dump(), which the table has always shown
+TRANSACTION_FIELDS = ["symbol", "quantity", "price", "timestamp", "rationale"]
+
 class Trader:
     def __init__(self, name: str, lastname: str, model_name: str):
         self.name = name
@@ -61,24 +64,22 @@ class Trader:
         fig.update_yaxes(tickfont=dict(size=8), tickformat=",.0f")
         return fig
 
-    def get_holdings_df(self) -> pd.DataFrame:
-        """Convert holdings to DataFrame for display"""
+    def get_holdings_df(self) -> dict:
+        """Holdings as headers and rows for the Dataframe component"""
         holdings = self.account.get_holdings()
-        if not holdings:
-            return pd.DataFrame(columns=["Symbol", "Quantity"])
-
-        df = pd.DataFrame(
-            [{"Symbol": symbol, "Quantity": quantity} for symbol, quantity in holdings.items()]
-        )
-        return df
-
-    def get_transactions_df(self) -> pd.DataFrame:
-        """Convert transactions to DataFrame for display"""
-        transactions = self.account.list_transactions()
-        if not transactions:
-            return pd.DataFrame(columns=["Timestamp", "Symbol", "Quantity", "Price", "Rationale"])
-
-        return pd.DataFrame(transactions)
+        return {"headers": ["Symbol", "Quantity"], "data": [list(item) for item in holdings.items()]}
+
+    def get_transactions_df(self) -> dict:
+        """Transactions as headers and rows for the Dataframe component"""
+        if not self.account.transactions:
+            return {"headers": ["Timestamp", "Symbol", "Quantity", "Price", "Rationale"], "data": []}
+        return {
+            "headers": TRANSACTION_FIELDS,
+            "data": [
+                [t.symbol, t.quantity, t.price, t.timestamp, t.rationale]
+                for t in self.account.transactions
+            ],
+        }
 
     def get_portfolio_value(self) -> str:
         """Calculate total portfolio value based on current prices"""
@@ -1,10 +1,10 @@
 from typing import Literal
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 import json
 from dotenv import load_dotenv
 from datetime import datetime
 from market import get_share_price
-from database import write_account, read_account, write_log
+from database import write_account, read_account, read_accounts, write_log
 # from util import client
 from reset import strategy_mapper
 
@@ -35,16 +35,28 @@ class Account(BaseModel):
     holdings: dict[str, int]
     transactions: list[Transaction]
     portfolio_value_time_series: list[tuple[str, float]]
+    # Bumped on every save and persisted alongside the account, so readers in
+    # other processes can tell whether anything changed; kept out of reports.
+    version: int = Field(default=0, exclude=True)
 
     @classmethod
     def get(cls, name: str):
+        return cls._from_fields(name, read_account(name.lower()))
+
+    @classmethod
+    def get_many(cls, names: list[str]) -> dict[str, "Account"]:
+        """Load several accounts with a single query, keyed by the names given."""
+        rows = read_accounts(names)
+        return {name: cls._from_fields(name, rows.get(name.lower())) for name in names}
+
+    @classmethod
+    def _from_fields(cls, name: str, fields: dict | None):
 
         # account_info = client.get_account()
         account_info =  None
         portfolio_val = (
             getattr(account_info, "portfolio_value", None) or INITIAL_BALANCE
         )
-        fields = read_account(name.lower())
         if not fields or fields["balance"] != portfolio_val:
 
             fields = {
@@ -63,7 +75,8 @@ class Account(BaseModel):
         write_log(name, type, message)
 
     def save(self):
-        write_account(self.name.lower(), self.model_dump())
+        self.version += 1
+        write_account(self.name.lower(), {**self.model_dump(), "version": self.version})
 
     def reset(self, strategy: str):
         # account_info = client.get_account()
@@ -158,11 +171,10 @@ class Account(BaseModel):
         write_log(self.name, "account", f"Sold {quantity} of {symbol}")
         return "Completed. Latest details:\n" + self.report()
 
-    def update_holdings_and_transactions(
+    def apply_holdings_update(
         self, action: Literal["buy", "sell"], symbol: str, quantity: int, rationale: str, price: float
-    ) -> bool:
-        """Update holdings and record a transaction for manual adjustments."""
-        print(f"DEBUG: Updating {action} for {symbol}, quantity: {quantity}, price: {price}")  # ← Add this
+    ) -> Transaction:
+        """Apply a manual holdings adjustment in memory, without saving or logging."""
         if action == "buy":
             self.holdings[symbol] = self.holdings.get(symbol, 0) + quantity
             signed_quantity = quantity
@@ -184,6 +196,14 @@ class Account(BaseModel):
             rationale=rationale,
         )
         self.transactions.append(transaction)
+        return transaction
+
+    def update_holdings_and_transactions(
+        self, action: Literal["buy", "sell"], symbol: str, quantity: int, rationale: str, price: float
+    ) -> bool:
+        """Update holdings and record a transaction for manual adjustments."""
+        print(f"DEBUG: Updating {action} for {symbol}, quantity: {quantity}, price: {price}")  # ← Add this
+        self.apply_holdings_update(action, symbol, quantity, rationale, price)
         print(f"DEBUG: Before save - holdings: {self.holdings}, transactions count: {len(self.transactions)}")  # ← Add this
         self.save()
         print(f"DEBUG: After save - account saved successfully")  # ← Add this
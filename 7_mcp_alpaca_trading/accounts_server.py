@@ -1,8 +1,92 @@
+import asyncio
 from mcp.server.fastmcp import FastMCP
 from accounts import Account
+from database import write_logs
 
 mcp = FastMCP("accounts_server")
 
+# Account writes are coalesced per account: each worker lingers briefly for more
+# operations, applies the batch to one loaded Account and saves it once.
+BATCH_SIZE = 16
+LINGER_SECONDS = 0.05
+
+_pending: dict[str, asyncio.Queue] = {}
+_workers: dict[str, asyncio.Task] = {}
+_locks: dict[str, asyncio.Lock] = {}
+
+
+def _lock_for(name: str) -> asyncio.Lock:
+    """Per-account lock serialising load-modify-save cycles on one account while others proceed."""
+    key = name.lower()
+    lock = _locks.get(key)
+    if lock is None:
+        lock = _locks[key] = asyncio.Lock()
+    return lock
+
+
+async def _submit(name: str, op: tuple) -> None:
+    """Queue an operation for the account and wait until its batch is flushed."""
+    key = name.lower()
+    queue = _pending.get(key)
+    if queue is None:
+        queue = _pending[key] = asyncio.Queue()
+        _workers[key] = asyncio.create_task(_drain(key, queue))
+    future = asyncio.get_running_loop().create_future()
+    await queue.put((op, future))
+    await future
+
+
+async def _drain(name: str, queue: asyncio.Queue) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + LINGER_SECONDS
+        while len(batch) < BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        # The database work runs in a thread so the MCP loop keeps serving other calls
+        async with _lock_for(name):
+            try:
+                outcomes = await asyncio.to_thread(_flush, name, [op for op, _ in batch])
+            except Exception as e:
+                outcomes = [e] * len(batch)
+        for (_, future), outcome in zip(batch, outcomes):
+            if future.done():
+                continue
+            if outcome is None:
+                future.set_result(None)
+            else:
+                future.set_exception(outcome)
+
+
+def _flush(name: str, ops: list[tuple]) -> list[Exception | None]:
+    """Apply a batch to one loaded account and save it once; returns each op's error, if any."""
+    account = None
+    logs = []
+    outcomes = []
+    for action, *args in ops:
+        if action == "log":
+            logs.append((name, *args))
+        else:
+            if account is None:
+                account = Account.get(name)
+            try:
+                account.apply_holdings_update(action, *args)
+            except ValueError as e:
+                outcomes.append(e)
+                continue
+            logs.append((name, "transactions", f"Updated transactions and holdings for {args[0]}"))
+        outcomes.append(None)
+    if account is not None:
+        account.save()
+    write_logs(logs)
+    return outcomes
+
 
 @mcp.tool()
 async def update_buy_account_holdings_transactions(
@@ -10,12 +94,7 @@ async def update_buy_account_holdings_transactions(
 ) -> dict[str, str]:
     """Update account holdings when you buy shares for the specific account."""
     print(f"update transactions for {symbol}")
-
-    account = Account.get(name)
-    account.update_holdings_and_transactions(
-        "buy", symbol, quantity, rationale, price
-    )
-    account.save()  # ← Ensure save is called
+    await _submit(name, ("buy", symbol, quantity, rationale, price))
     return {"status": "ok", "message": f"Updated holding {symbol} "}
 
 @mcp.tool()
@@ -25,11 +104,7 @@ async def update_sell_account_holdings_transactions(
     """Update account holdings when you sell shares for the specific account."""
 
     print(f"update transactions for {symbol}")
-    account = Account.get(name)
-    account.update_holdings_and_transactions(
-        "sell", symbol, quantity, rationale, price
-    )
-    account.save()  # ← Ensure save is called
+    await _submit(name, ("sell", symbol, quantity, rationale, price))
     return {"status": "ok", "message": f"Updated holding {symbol} "}
 
 @mcp.tool()
@@ -42,14 +117,14 @@ async def update_log_trade(name: str, type: str, message: str) -> str:
         type: Log type, e.g. "BUY", "SELL", "ERROR", "STRATEGY"
         message: A descriptive message explaining the activity
     """
-    Account.write_log(name, type, message)
+    await _submit(name, ("log", type, message))
     return "ok"
 
 
 @mcp.tool()
 async def get_strategy(name: str) -> str:
-    acct = Account.get(name)
-    return acct.get_strategy()
+    acct = await asyncio.to_thread(Account.get, name)
+    return await asyncio.to_thread(acct.get_strategy)
 
 
 @mcp.tool()
@@ -60,19 +135,20 @@ async def change_strategy(name: str, strategy: str) -> str:
         name: The name of the account holder
         strategy: The new strategy for the account
     """
-    return Account.get(name).change_strategy(strategy)
+    async with _lock_for(name):
+        return await asyncio.to_thread(lambda: Account.get(name).change_strategy(strategy))
 
 
 @mcp.resource("accounts://accounts_server/{name}")
 async def read_account_resource(name: str) -> str:
-    account = Account.get(name.lower())
-    return account.report()
+    # report() records a value point and saves, so it must not interleave with a flush
+    async with _lock_for(name):
+        return await asyncio.to_thread(lambda: Account.get(name.lower()).report())
 
 
 @mcp.resource("accounts://strategy/{name}")
 async def read_strategy_resource(name: str) -> str:
-    account = Account.get(name.lower())
-    return account.get_strategy()
+    return await asyncio.to_thread(lambda: Account.get(name.lower()).get_strategy())
 
 
 if __name__ == "__main__":
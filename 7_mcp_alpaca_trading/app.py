@@ -1,15 +1,16 @@
 from hmac import trans_36
 import gradio as gr
 from util import css, js, Color
+import numpy as np
 import pandas as pd
 from trading_floor import names, lastnames, short_model_names
 import plotly.express as px
 from accounts import Account, INITIAL_BALANCE
-from database import read_log
-import threading
+from database import read_log, read_log_batch
 from trading_floor import run_every_n_minutes
-from util import stop_event
 import asyncio
+import html
+import logging
 import os
 
 mapper = {
@@ -20,6 +21,9 @@ mapper = {
     "response": Color.MAGENTA,
     "account": Color.RED,
 }
+# Plain strings, so the per-row lookup in get_logs skips enum formatting
+LOG_COLORS = {type: str(color) for type, color in mapper.items()}
+DEFAULT_COLOR = str(Color.WHITE)
 
 # ---------------- HuggingFace Spaces ENV FIX ----------------
 REQUIRED_KEYS = ["ALPACA_API_KEY", "ALPACA_SECRET_KEY", "ALPACA_PAPER"]
@@ -36,14 +40,25 @@ force_env()
 # -------------------------------------------------------------
 
 
-trading_thread = None
+trading_task: asyncio.Task | None = None
+trading_stop_event: asyncio.Event | None = None
+LOG_LINES = 13
+# The UI timer ticks every second; the heavier panels refresh every two minutes
+REFRESH_TICKS = 120
+
+# Column order of Transaction.model_dump(), which the table has always shown
+TRANSACTION_FIELDS = ["symbol", "quantity", "price", "timestamp", "rationale"]
+# Only the most recent transactions are sent to the browser on each refresh
+TRANSACTION_ROWS = 50
 
 class Trader:
-    def __init__(self, name: str, lastname: str, model_name: str):
+    def __init__(self, name: str, lastname: str, model_name: str, account: Account | None = None):
         self.name = name
         self.lastname = lastname
         self.model_name = model_name
-        self.account = Account.get(name)
+        self.account = account if account is not None else Account.get(name)
+        self._df_cache = (None, None)
+        self._chart_cache = (None, None)
 
     def reload(self):
         self.account = Account.get(self.name)
@@ -54,12 +69,30 @@ class Trader:
     def get_strategy(self) -> str:
         return self.account.get_strategy()
 
+    def _series_key(self) -> tuple:
+        # The time series is append-only, so its length and last timestamp identify it
+        series = self.account.portfolio_value_time_series
+        return (len(series), series[-1][0] if series else None)
+
     def get_portfolio_value_df(self) -> pd.DataFrame:
-        df = pd.DataFrame(self.account.portfolio_value_time_series, columns=["datetime", "value"])
-        df["datetime"] = pd.to_datetime(df["datetime"])
+        key = self._series_key()
+        cached_key, df = self._df_cache
+        if key == cached_key:
+            return df
+        series = self.account.portfolio_value_time_series
+        count = len(series)
+        # Parse straight into typed arrays; count=0 yields correctly typed empty columns
+        dt = np.fromiter((t for t, _ in series), dtype="datetime64[s]", count=count)
+        values = np.fromiter((v for _, v in series), dtype="f8", count=count)
+        df = pd.DataFrame({"datetime": dt.astype("datetime64[ns]"), "value": values})
+        self._df_cache = (key, df)
         return df
 
     def get_portfolio_value_chart(self):
+        key = self._series_key()
+        cached_key, fig = self._chart_cache
+        if key == cached_key:
+            return fig
         df = self.get_portfolio_value_df()
         fig = px.line(df, x="datetime", y="value")
         margin = dict(l=40, r=20, t=20, b=40)
@@ -73,26 +106,25 @@ class Trader:
         )
         fig.update_xaxes(tickformat="%m/%d", tickangle=45, tickfont=dict(size=8))
         fig.update_yaxes(tickfont=dict(size=8), tickformat=",.0f")
+        self._chart_cache = (key, fig)
         return fig
 
-    def get_holdings_df(self) -> pd.DataFrame:
-        """Convert holdings to DataFrame for display"""
+    def get_holdings_df(self) -> dict:
+        """Holdings as headers and rows for the Dataframe component"""
         holdings = self.account.get_holdings()
-        if not holdings:
-            return pd.DataFrame(columns=["Symbol", "Quantity"])
-
-        df = pd.DataFrame(
-            [{"Symbol": symbol, "Quantity": quantity} for symbol, quantity in holdings.items()]
-        )
-        return df
-
-    def get_transactions_df(self) -> pd.DataFrame:
-        """Convert transactions to DataFrame for display"""
-        transactions = self.account.list_transactions()
-        if not transactions:
-            return pd.DataFrame(columns=["Timestamp", "Symbol", "Quantity", "Price", "Rationale"])
-
-        return pd.DataFrame(transactions)
+        return {"headers": ["Symbol", "Quantity"], "data": [list(item) for item in holdings.items()]}
+
+    def get_transactions_df(self) -> dict:
+        """Transactions as headers and rows for the Dataframe component"""
+        if not self.account.transactions:
+            return {"headers": ["Timestamp", "Symbol", "Quantity", "Price", "Rationale"], "data": []}
+        return {
+            "headers": TRANSACTION_FIELDS,
+            "data": [
+                [t.symbol, t.quantity, t.price, t.timestamp, t.rationale]
+                for t in self.account.transactions[-TRANSACTION_ROWS:]
+            ],
+        }
 
     def get_portfolio_value(self) -> str:
         """Calculate total portfolio value based on current prices"""
@@ -103,14 +135,14 @@ class Trader:
         emoji = "⬆" if pnl >= 0 else "⬇"
         return f"<div style='text-align: center;background-color:{color};'><span style='font-size:32px'>${portfolio_value:,.0f}</span><span style='font-size:24px'>&nbsp;&nbsp;&nbsp;{emoji}&nbsp;${pnl:,.0f}</span></div>"
 
-    def get_logs(self, previous=None) -> str:
-        logs = read_log(self.name, last_n=13)
-        response = ""
-        for log in logs:
-            timestamp, type, message = log
-            color = mapper.get(type, Color.WHITE).value
-            response += f"<span style='color:{color}'>{timestamp} : [{type}] {message}</span><br/>"
-        response = f"<div style='height:250px; overflow-y:auto;'>{response}</div>"
+    def get_logs(self, previous=None, logs=None) -> str:
+        if logs is None:
+            logs = read_log(self.name, last_n=LOG_LINES)
+        body = "".join(
+            f"<span style='color:{LOG_COLORS.get(type, DEFAULT_COLOR)}'>{timestamp} : [{html.escape(type)}] {html.escape(message)}</span><br/>"
+            for timestamp, type, message in logs
+        )
+        response = f"<div style='height:250px; overflow-y:auto;'>{body}</div>"
         if response != previous:
             return response
         return gr.update()
@@ -156,31 +188,24 @@ class TraderView:
                     elem_classes=["dataframe-fix"],
                 )
 
-        timer = gr.Timer(value=120)
-        timer.tick(
-            fn=self.refresh,
-            inputs=[],
-            outputs=[
-                self.portfolio_value,
-                self.chart,
-                self.holdings_table,
-                self.transactions_table,
-            ],
-            show_progress="hidden",
-            queue=False,
-        )
-        log_timer = gr.Timer(value=0.5)
-        log_timer.tick(
-            fn=self.trader.get_logs,
-            inputs=[self.log],
-            outputs=[self.log],
-            show_progress="hidden",
-            queue=False,
-        )
-
-    def refresh(self):
+    def outputs(self) -> list:
+        """Components updated by the shared timer, in the order of refresh() plus the log"""
+        return [
+            self.portfolio_value,
+            self.chart,
+            self.holdings_table,
+            self.transactions_table,
+            self.log,
+        ]
+
+    def refresh(self, last_version: int = -1) -> tuple[int, tuple]:
+        """Reload the account; returns its version and the panel updates for a session that last saw last_version"""
         self.trader.reload()
-        return (
+        version = self.trader.account.version
+        if version == last_version:
+            # Only prices can have moved; leave the chart and tables alone
+            return version, (self.trader.get_portfolio_value(), gr.update(), gr.update(), gr.update())
+        return version, (
             self.trader.get_portfolio_value(),
             self.trader.get_portfolio_value_chart(),
             self.trader.get_holdings_df(),
@@ -190,70 +215,65 @@ class TraderView:
 MEMORY_DIR = "memory"
 def setup_directories():
     """Ensures the directory for the libSQL databases exists."""
-    if not os.path.exists(MEMORY_DIR):
-        try:
-            os.makedirs(MEMORY_DIR, exist_ok=True)
-            print(f"Created directory: {MEMORY_DIR}/")
-        except OSError as e:
-            # Important: Log the error if directory creation fails (e.g., due to permissions)
-            print(f"Error creating directory {MEMORY_DIR}: {e}")
-            raise
-
-def stop_trading_thread():
-    global trading_thread
-
-    if trading_thread is None or not trading_thread.is_alive():
+    try:
+        os.makedirs(MEMORY_DIR, exist_ok=True)
+    except OSError as e:
+        # Important: Log the error if directory creation fails (e.g., due to permissions)
+        print(f"Error creating directory {MEMORY_DIR}: {e}")
+        raise
+
+async def stop_trading_thread():
+    global trading_task
+
+    if trading_task is None or trading_task.done():
         return "🛑 Trading floor is not running."
 
     print("Stopping trading floor...")
     
     # 1. Set the stop signal
-    stop_event.set()
-    
-    # 2. Wait for the thread to finish its current task and exit the loop safely
-    trading_thread.join(timeout=10) # Wait up to 10 seconds for graceful exit
+    trading_stop_event.set()
     
-    if trading_thread.is_alive():
-        return "❌ Trading floor thread failed to stop gracefully within 10 seconds."
-    else:
-        trading_thread = None # Clear the variable
-        return "✅ Trading floor stopped successfully."
-
-def start_trading_floor_and_thread():
-    global trading_thread
-
-    # check is thead is running
-    if trading_thread is not None and trading_thread.is_alive():
+    # 2. Wait for the task to finish its current cycle and exit the loop safely
+    try:
+        await asyncio.wait_for(asyncio.shield(trading_task), timeout=10)
+    except asyncio.TimeoutError:
+        trading_task.cancel()
+        trading_task = None
+        return "⚠️ Trading floor did not stop within 10 seconds and was cancelled."
+    except Exception:
+        pass  # Already reported by _report_trading_error
+    trading_task = None # Clear the variable
+    return "✅ Trading floor stopped successfully."
+
+def _report_trading_error(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        print(f"Error running trading floor: {task.exception()}")
+
+async def start_trading_floor_and_thread():
+    global trading_task, trading_stop_event
+
+    # check if the task is running
+    if trading_task is not None and not trading_task.done():
         return "⚠️ Trading floor is already running."
 
-    # Reset the stop event and create directory
-    stop_event.clear()
+    # Fresh stop event for this run, bound to the loop it is created on, and create directory
+    trading_stop_event = asyncio.Event()
     setup_directories()
+    force_env()
 
-    # 3. Define the thread's target function (wrapper to pass the event)
-    def target_wrapper():
-        # re-inject the environment variables
-        force_env()
-        # The target function now correctly passes the stop_event
-        try:
-            asyncio.run(run_every_n_minutes())
-        except Exception as e:
-            print(f"Error running trading floor: {e}")
-            return "❌ Trading floor failed to start."
-
-    # 4. Create and start the thread
-    trading_thread = threading.Thread(target=target_wrapper, daemon=True)
-    trading_thread.start()
+    # Run on Gradio's own event loop so the trading floor shares it with the UI
+    trading_task = asyncio.create_task(run_every_n_minutes(trading_stop_event))
+    trading_task.add_done_callback(_report_trading_error)
     return "🚀 Trading floor started."
 
 
 # Main UI construction
 def create_ui():
     """Create the main Gradio UI for the trading simulation"""
-    print(f"Stop event {stop_event.is_set()}")
 
+    accounts = Account.get_many(names)
     traders = [
-        Trader(trader_name, lastname, model_name)
+        Trader(trader_name, lastname, model_name, accounts[trader_name])
         for trader_name, lastname, model_name in zip(names, lastnames, short_model_names)
     ]
     trader_views = [TraderView(trader) for trader in traders]
@@ -289,9 +309,44 @@ def create_ui():
             for trader_view in trader_views:
                 trader_view.make_ui()
 
+        # One timer drives every panel: logs on each tick, the rest every REFRESH_TICKS
+        # Versions are tracked per browser session, since each renders independently
+        def tick(count, versions, *previous):
+            count += 1
+            refresh = count % REFRESH_TICKS == 0
+            batch = read_log_batch([trader.name for trader in traders], last_n=LOG_LINES)
+            versions = list(versions)
+            updates = []
+            for i, (trader_view, prev) in enumerate(zip(trader_views, previous)):
+                trader = trader_view.trader
+                if refresh:
+                    versions[i], panels = trader_view.refresh(versions[i])
+                else:
+                    panels = (gr.update(),) * 4
+                updates.extend(panels)
+                updates.append(trader.get_logs(prev, batch[trader.name.lower()]))
+            return [count, versions, *updates]
+
+        tick_count = gr.State(0)
+        rendered_versions = gr.State([-1] * len(trader_views))
+        timer = gr.Timer(value=1.0)
+        timer.tick(
+            fn=tick,
+            inputs=[tick_count, rendered_versions, *(trader_view.log for trader_view in trader_views)],
+            outputs=[
+                tick_count,
+                rendered_versions,
+                *(c for trader_view in trader_views for c in trader_view.outputs()),
+            ],
+            show_progress="hidden",
+            queue=False,
+        )
+
     return ui
 
 
 if __name__ == "__main__":
+    # Surface the trading floor's progress messages when it runs under the UI
+    logging.basicConfig(level=logging.INFO)
     ui = create_ui()
     ui.launch(inbrowser=True)
@@ -1,4 +1,5 @@
 import sqlite3
+import threading
 import json
 from datetime import datetime
 from dotenv import load_dotenv
@@ -7,8 +8,20 @@ load_dotenv(override=True)
 
 DB = "accounts.db"
 
+_local = threading.local()
 
-with sqlite3.connect(DB) as conn:
+
+def _connection() -> sqlite3.Connection:
+    """One long-lived connection per thread instead of an open/close per call."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        _local.conn = conn
+    return conn
+
+
+with _connection() as conn:
     cursor = conn.cursor()
     cursor.execute('CREATE TABLE IF NOT EXISTS accounts (name TEXT PRIMARY KEY, account TEXT)')
     cursor.execute('''
@@ -21,11 +34,15 @@ with sqlite3.connect(DB) as conn:
         )
     ''')
     cursor.execute('CREATE TABLE IF NOT EXISTS market (date TEXT PRIMARY KEY, data TEXT)')
+    # Serves read_log/read_log_batch as an index range scan instead of a scan and sort
+    cursor.execute('CREATE INDEX IF NOT EXISTS logs_name_datetime ON logs (name, datetime DESC, id DESC)')
+    # WAL is persistent, and lets the UI read logs while the traders write them
+    conn.execute('PRAGMA journal_mode=WAL')
     conn.commit()
 
 def write_account(name, account_dict):
     json_data = json.dumps(account_dict)
-    with sqlite3.connect(DB) as conn:
+    with _connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             INSERT INTO accounts (name, account)
@@ -35,11 +52,21 @@ def write_account(name, account_dict):
         conn.commit()
 
 def read_account(name):
-    with sqlite3.connect(DB) as conn:
+    with _connection() as conn:
         cursor = conn.cursor()
         cursor.execute('SELECT account FROM accounts WHERE name = ?', (name.lower(),))
         row = cursor.fetchone()
         return json.loads(row[0]) if row else None
+
+def read_accounts(names):
+    keys = [name.lower() for name in names]
+    if not keys:
+        return {}
+    placeholders = ", ".join("?" * len(keys))
+    with _connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f'SELECT name, account FROM accounts WHERE name IN ({placeholders})', keys)
+        return {name: json.loads(account) for name, account in cursor.fetchall()}
     
 def write_log(name: str, type: str, message: str):
     """
@@ -52,7 +79,7 @@ def write_log(name: str, type: str, message: str):
     """
     now = datetime.now().isoformat()
     
-    with sqlite3.connect(DB) as conn:
+    with _connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             INSERT INTO logs (name, datetime, type, message)
@@ -60,6 +87,24 @@ def write_log(name: str, type: str, message: str):
         ''', (name.lower(), type, message))
         conn.commit()
 
+def write_logs(entries):
+    """
+    Write several log entries to the logs table in one transaction.
+    
+    Args:
+        entries (iterable): (name, type, message) tuples, written in order
+    """
+    rows = [(name.lower(), type, message) for name, type, message in entries]
+    if not rows:
+        return
+    with _connection() as conn:
+        cursor = conn.cursor()
+        cursor.executemany('''
+            INSERT INTO logs (name, datetime, type, message)
+            VALUES (?, datetime('now'), ?, ?)
+        ''', rows)
+        conn.commit()
+
 def read_log(name: str, last_n=10):
     """
     Read the most recent log entries for a given name.
@@ -71,20 +116,52 @@ def read_log(name: str, last_n=10):
     Returns:
         list: A list of tuples containing (datetime, type, message)
     """
-    with sqlite3.connect(DB) as conn:
+    with _connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT datetime, type, message FROM logs 
             WHERE name = ? 
-            ORDER BY datetime DESC
+            ORDER BY datetime DESC, id DESC
             LIMIT ?
         ''', (name.lower(), last_n))
         
         return reversed(cursor.fetchall())
 
+def read_log_batch(names: list[str], last_n=10):
+    """
+    Read the most recent log entries for several names in a single query.
+    
+    Args:
+        names (list[str]): The names to retrieve logs for
+        last_n (int): Number of most recent entries to retrieve per name
+        
+    Returns:
+        dict: Maps each lower-cased name to a list of (datetime, type, message) tuples, oldest first
+    """
+    keys = [name.lower() for name in names]
+    batch = {key: [] for key in keys}
+    if not keys:
+        return batch
+    placeholders = ", ".join("?" * len(keys))
+    with _connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            SELECT name, datetime, type, message FROM (
+                SELECT id, name, datetime, type, message,
+                       ROW_NUMBER() OVER (PARTITION BY name ORDER BY datetime DESC, id DESC) AS rn
+                FROM logs
+                WHERE name IN ({placeholders})
+            )
+            WHERE rn <= ?
+            ORDER BY name, datetime, id
+        ''', (*keys, last_n))
+        for name, *entry in cursor.fetchall():
+            batch[name].append(tuple(entry))
+    return batch
+
 def write_market(date: str, data: dict) -> None:
     data_json = json.dumps(data)
-    with sqlite3.connect(DB) as conn:
+    with _connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             INSERT INTO market (date, data)
@@ -94,7 +171,7 @@ def write_market(date: str, data: dict) -> None:
         conn.commit()
 
 def read_market(date: str) -> dict | None:
-    with sqlite3.connect(DB) as conn:
+    with _connection() as conn:
         cursor = conn.cursor()
         cursor.execute('SELECT data FROM market WHERE date = ?', (date,))
         row = cursor.fetchone()
@@ -1,3 +1,4 @@
+from types import MappingProxyType
 
 waren_strategy = """
 You are Warren, and you are named in homage to your role model, Warren Buffett.
@@ -65,14 +66,15 @@ RISK MANAGEMENT RULES:
 - Scale back in during major drawdowns to average in
 """
 
-def strategy_mapper(name: str) -> str:
-    mapper = {}
-    mapper["warren"] = waren_strategy
-    mapper["george"] = george_strategy
-    mapper["ray"] = ray_strategy
-    mapper["cathie"] = cathie_strategy
+_STRATEGY_MAP = MappingProxyType({
+    "warren": waren_strategy,
+    "george": george_strategy,
+    "ray": ray_strategy,
+    "cathie": cathie_strategy,
+})
 
-    return mapper.get(name, "")
+def strategy_mapper(name: str) -> str:
+    return _STRATEGY_MAP.get(name.lower(), "")
     
 # def reset_traders():
 #     Account.get("Warren").reset(waren_strategy)
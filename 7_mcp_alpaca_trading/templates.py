@@ -1,3 +1,5 @@
+import time
+from functools import lru_cache
 from datetime import datetime
 from market import is_paid_polygon, is_realtime_polygon
 
@@ -8,8 +10,7 @@ elif is_paid_polygon:
 else:
     note = "You have access to end of day market data; use you get_share_price tool to get the share price as of the prior close."
 
-def researcher_instructions():
-    return f"""You are a financial researcher. You are able to search the web for interesting financial news,
+_RESEARCHER_TEMPLATE = """You are a financial researcher. You are able to search the web for interesting financial news,
 look for possible trading opportunities, and help with research.
 Based on the request, you carry out necessary research and respond with your findings.
 
@@ -41,18 +42,16 @@ Draw on your knowledge graph to build your expertise over time.
 
 If there isn't a specific request, then respond with investment opportunities based on searching latest news.
 
-The current datetime is {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+The current datetime is {now}
 """
 
-def research_tool():
-    return "This tool researches online for news and opportunities, \
+_RESEARCH_TOOL = "This tool researches online for news and opportunities, \
 either based on your specific request to look into a certain stock, \
 or generally for notable financial news and opportunities. \
 Describe what kind of research you're looking for."
 
 
-def trader_instructions(name: str):
-    return f"""
+_TRADER_TEMPLATE = """
 You are {name}, a live trading agent connected to a real Alpaca brokerage account.
 
 ==============================
@@ -150,8 +149,7 @@ Trade professionally, maintain accurate records, and NEVER skip the logging step
 """
 
 
-def trade_message(name, strategy, account):
-    return f"""Based on your investment strategy, look for new opportunities.
+_TRADE_TEMPLATE = """Based on your investment strategy, look for new opportunities.
 
 Use the research tool to find news and opportunities consistent with your strategy.
 Use tools to research stock prices, crypto, options and company information. {note}
@@ -173,14 +171,13 @@ Your investment strategy:
 Current account:
 {account}
 
-Current datetime: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+Current datetime: {now}
 Your account name: {name}
 
 Now: research → decide → trade → LOG EACH TRADE → send notification → provide 2-3 sentence appraisal.
 """
 
-def rebalance_message(name, strategy, account):
-    return f"""Based on your investment strategy, you should now examine your portfolio and decide if you need to rebalance.
+_REBALANCE_TEMPLATE = """Based on your investment strategy, you should now examine your portfolio and decide if you need to rebalance.
 Use the research tool to find news and opportunities affecting your existing portfolio.
 Use the tools to research stock price and other company information affecting your existing portfolio. {note}
 Finally, make you decision, then execute trades using the tools as needed.
@@ -192,7 +189,48 @@ You also have a tool to change your strategy if you wish; you can decide at any
 Here is your current account:
 {account}
 Here is the current datetime:
-{datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+{now}
 Now, carry out analysis, make your decision and execute trades. Your account name is {name}.
 After you've executed your trades, send a push notification with a brief sumnmary of trades and the health of the portfolio, then
-respond with a brief 2-3 sentence appraisal of your portfolio and its outlook."""
\ No newline at end of file
+respond with a brief 2-3 sentence appraisal of your portfolio and its outlook."""
+
+# Only the name, strategy, account and timestamp vary between calls; the market
+# data note is fixed for the process, so it is baked into the templates once.
+_TRADE_TEMPLATE = _TRADE_TEMPLATE.replace("{note}", note)
+_REBALANCE_TEMPLATE = _REBALANCE_TEMPLATE.replace("{note}", note)
+
+# The researcher prompt only varies by timestamp, so it is rendered by concatenation
+_RESEARCHER_PREFIX, _RESEARCHER_SUFFIX = _RESEARCHER_TEMPLATE.split("{now}")
+
+
+@lru_cache(maxsize=1)
+def _now_key(epoch_sec: int) -> str:
+    return datetime.fromtimestamp(epoch_sec).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _now_str() -> str:
+    """Current local time, formatted at most once per second."""
+    return _now_key(int(time.time()))
+
+
+def researcher_instructions():
+    return _RESEARCHER_PREFIX + _now_str() + _RESEARCHER_SUFFIX
+
+def research_tool():
+    return _RESEARCH_TOOL
+
+
+@lru_cache(maxsize=32)
+def trader_instructions(name: str):
+    return _TRADER_TEMPLATE.format_map({"name": name})
+
+
+def trade_message(name, strategy, account):
+    return _TRADE_TEMPLATE.format_map(
+        {"name": name, "strategy": strategy, "account": account, "now": _now_str()}
+    )
+
+def rebalance_message(name, strategy, account):
+    return _REBALANCE_TEMPLATE.format_map(
+        {"name": name, "strategy": strategy, "account": account, "now": _now_str()}
+    )
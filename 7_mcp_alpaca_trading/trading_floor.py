@@ -1,20 +1,22 @@
-import threading
 from traders import Trader
-from typing import List
+from typing import List, NamedTuple
 import asyncio
+import logging
+import signal
+import time
 from tracers import LogTracer
 from agents import add_trace_processor
 from dotenv import load_dotenv
-from util import stop_event, alpaca_is_market_open
+from util import alpaca_is_market_open, env_bool, api_key, secret_key
 import os
 
 load_dotenv(override=True)
 
+logger = logging.getLogger(__name__)
+
 RUN_EVERY_N_MINUTES = int(os.getenv("RUN_EVERY_N_MINUTES", "60"))
-RUN_EVEN_WHEN_MARKET_IS_CLOSED = (
-    os.getenv("RUN_EVEN_WHEN_MARKET_IS_CLOSED", "false").strip().lower() == "true"
-)
-USE_MANY_MODELS = os.getenv("USE_MANY_MODELS", "false").strip().lower() == "true"
+RUN_EVEN_WHEN_MARKET_IS_CLOSED = env_bool("RUN_EVEN_WHEN_MARKET_IS_CLOSED")
+USE_MANY_MODELS = env_bool("USE_MANY_MODELS")
 
 names = ["Warren", "George", "Ray", "Cathie"]
 lastnames = ["Patience", "Bold", "Systematic", "Crypto"]
@@ -32,65 +34,86 @@ else:
     short_model_names = ["GPT 4.1 mini"] * 4
 
 
+class TraderSpec(NamedTuple):
+    name: str
+    lastname: str
+    model_name: str
+
+
+TRADER_SPECS = tuple(TraderSpec(*spec) for spec in zip(names, lastnames, model_names))
+
+
 def create_traders() -> List[Trader]:
-    traders = []
-    for name, lastname, model_name in zip(names, lastnames, model_names):
-        traders.append(Trader(name, lastname, model_name))
-    return traders
+    return [Trader(*spec) for spec in TRADER_SPECS]
+
 
+async def _run_cycle(traders: List[Trader]):
+    # The TaskGroup cancels every trader together when the cycle is cancelled
+    async with asyncio.TaskGroup() as tg:
+        for trader in traders:
+            tg.create_task(trader.run())
 
-async def run_every_n_minutes():
+
+async def run_every_n_minutes(stop_event: asyncio.Event):
     """
-    Runs trading agents every N minutes, cooperatively stopping when signaled.
+    Runs trading agents every N minutes, cooperatively stopping once stop_event is set.
+    The event must belong to the running loop, so callers create one per run.
     """
 
-    print(
-        "Thread env keys present:",
-        bool(os.getenv("ALPACA_API_KEY")),
-        bool(os.getenv("ALPACA_SECRET_KEY"))
-    )
+    logger.debug("Alpaca keys present: %s %s", bool(api_key), bool(secret_key))
     add_trace_processor(LogTracer())
     traders = create_traders()
-    
-    # Create an asyncio Event to link the thread signal to the loop
-    async_stop_event = asyncio.Event()
-
-    # Function to set the asyncio event from the thread's loop
-    def stop_callback():
-        # This function runs in the context of the running asyncio loop
-        if stop_event.is_set():
-            async_stop_event.set()
-        else:
-            # Re-schedule this check if the event hasn't been set
-            loop = asyncio.get_running_loop()
-            loop.call_later(1, stop_callback)
+    interval = RUN_EVERY_N_MINUTES * 60
+    next_run = time.monotonic()
 
-    # Start the periodic check for the threading.Event
-    loop = asyncio.get_running_loop()
-    loop.call_later(1, stop_callback)
-
-    while not async_stop_event.is_set():
-        if RUN_EVEN_WHEN_MARKET_IS_CLOSED or alpaca_is_market_open():
-            print("Running trade cycle...")
-            # Run agents
-            await asyncio.gather(*[trader.run() for trader in traders])
+    while not stop_event.is_set():
+        if RUN_EVEN_WHEN_MARKET_IS_CLOSED or await asyncio.to_thread(alpaca_is_market_open):
+            logger.info("Running trade cycle...")
+            # Run agents, abandoning the cycle as soon as a stop is requested
+            cycle_task = asyncio.create_task(_run_cycle(traders))
+            stop_task = asyncio.create_task(stop_event.wait())
+            await asyncio.wait({cycle_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+            for task in (cycle_task, stop_task):
+                task.cancel()
+            await asyncio.gather(cycle_task, stop_task, return_exceptions=True)
+            if stop_event.is_set():
+                break
         else:
-            print("Market is closed, skipping run")
+            logger.info("Market is closed, skipping run")
 
-        # Wait for the next interval OR the stop signal
+        # Cycles start at fixed offsets from the first one, so a long cycle doesn't push
+        # the rest back; slots it overran are skipped rather than run back-to-back.
+        # A zero interval keeps running cycles back-to-back.
+        now = time.monotonic()
+        next_run += interval
+        if interval <= 0:
+            next_run = now
+        elif next_run <= now:
+            next_run += ((now - next_run) // interval + 1) * interval
+
+        # Wait for the next slot OR the stop signal
         try:
-            # Wait for the interval, but be interruptible by async_stop_event.set()
-            await asyncio.wait_for(async_stop_event.wait(), timeout=RUN_EVERY_N_MINUTES * 60)
+            await asyncio.wait_for(stop_event.wait(), timeout=next_run - now)
         except asyncio.TimeoutError:
             # Timeout hit, continue to the next iteration
             continue
-        except Exception:
-            # The async_stop_event was set, or another issue occurred
-            break
         
-    print("Agent trading loop terminated safely.")
+    logger.info("Agent trading loop terminated safely.")
+
+
+async def run_until_signalled():
+    """
+    Standalone entry point: SIGINT/SIGTERM request a graceful stop through the loop's
+    own signal handling. Not used under the UI, which owns the process signals.
+    """
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+    await run_every_n_minutes(stop_event)
 
 
 if __name__ == "__main__":
-    print(f"Starting scheduler to run every {RUN_EVERY_N_MINUTES} minutes")
-    asyncio.run(run_every_n_minutes())
+    logging.basicConfig(level=logging.INFO)
+    logger.info("Starting scheduler to run every %s minutes", RUN_EVERY_N_MINUTES)
+    asyncio.run(run_until_signalled())
@@ -1,15 +1,11 @@
-from enum import Enum
-from alpaca.trading.client import TradingClient
-from alpaca.trading.requests import GetOrdersRequest
-from alpaca.trading.enums import OrderStatus
+from enum import StrEnum
+from concurrent.futures import ThreadPoolExecutor
 
-import threading
+import time
 import os
 from dotenv import load_dotenv
 load_dotenv(override=True)
 
-stop_event = threading.Event()
-
 css = """
 .positive-pnl {
     color: green !important;
@@ -50,7 +46,7 @@ function refresh() {
 }
 """
 
-class Color(Enum):
+class Color(StrEnum):
     RED = "#dd0000"
     GREEN = "#00dd00"
     YELLOW = "#dddd00"
@@ -59,27 +55,62 @@ class Color(Enum):
     CYAN = "#00dddd"
     WHITE = "#87CEEB"
 
+def env_bool(key: str, default: str = "false") -> bool:
+    """Parse a "true"/"false" environment flag; call once at import and keep the result."""
+    return os.getenv(key, default).strip().lower() == "true"
+
 api_key = os.getenv("ALPACA_API_KEY")
 secret_key = os.getenv("ALPACA_SECRET_KEY")
+ALPACA_PAPER = env_bool("ALPACA_PAPER", "true")
+
+_client = None
+
+def get_client():
+    """The shared Alpaca TradingClient, created on first use rather than at import."""
+    global _client
+    if _client is None:
+        from alpaca.trading.client import TradingClient
 
-client = TradingClient(
-    api_key=api_key,
-    secret_key=secret_key,
-    paper=os.getenv("ALPACA_PAPER", "true").lower() == "true"
-)
+        _client = TradingClient(
+            api_key=api_key,
+            secret_key=secret_key,
+            paper=ALPACA_PAPER
+        )
+    return _client
+
+def __getattr__(name):
+    # Keeps `from util import client` working without building the client on import
+    if name == "client":
+        return get_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# The market opens and closes a few times a day; reuse the clock answer briefly
+MARKET_CLOCK_TTL_SECONDS = 30
+_clock_cache = (float("-inf"), False)
 
 def alpaca_is_market_open() -> bool:
-    clock = client.get_clock()
-    return clock.is_open
+    global _clock_cache
+    now = time.monotonic()
+    if now - _clock_cache[0] < MARKET_CLOCK_TTL_SECONDS:
+        return _clock_cache[1]
+    is_open = get_client().get_clock().is_open
+    _clock_cache = (now, is_open)
+    return is_open
 
 def alpaca_cancel_stale_orders():
     """Cancels orders stuck in 'new' state before next trade."""
-    req = GetOrdersRequest(status=OrderStatus.OPEN)
+    from alpaca.trading.requests import GetOrdersRequest
+    from alpaca.trading.enums import QueryOrderStatus
+
+    client = get_client()
+    # The API only filters by open/closed/all; "new" is narrowed below. Ask for the
+    # maximum page so stale orders beyond the default 50 are not missed.
+    req = GetOrdersRequest(status=QueryOrderStatus.OPEN, limit=500)
     orders = client.get_orders(filter=req)
-    print(f"Order stale state {orders}")
-    count = 0
-    for o in orders:
-        if o.status == "new":
-            client.cancel_order_by_id(o.id)
-            count += 1
-    return count
\ No newline at end of file
+    stale = [o.id for o in orders if o.status == "new"]
+    if not stale:
+        return 0
+    # Each cancel is its own HTTP round trip, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=min(16, len(stale))) as executor:
+        list(executor.map(client.cancel_order_by_id, stale))
+    return len(stale)
\ No newline at end of file